@@ -13,36 +13,207 @@ GitHub 자동 동기화 스크립트
 사용법:
     from github_sync import GitHubSync
     
-    sync = GitHubSync(
+    # 종료 시 남은 대기열을 커밋 (대기열은 메모리에만 존재)
+    with GitHubSync(
         repo="GilbertKwak/ai-multiagent-framework-v4",
         token=os.getenv("GITHUB_TOKEN")
-    )
-    
-    sync.commit_execution_log(run_number=1, metrics={...})
-    sync.commit_benchmark_results(results={...})
-    sync.create_performance_issue_if_degraded(baseline=0.94, current=0.89)
+    ) as sync:
+        run_number = sync.increment_run()
+        sync.commit_execution_log(run_number=run_number, metrics={...})
+        sync.commit_benchmark_results(results={...})
+        sync.create_performance_issue_if_degraded(baseline=0.94, current=0.89)
+
+비동기 사용법 (httpx 필요):
+    async with AsyncGitHubSync(repo="GilbertKwak/ai-multiagent-framework-v4") as sync:
+        run_number = sync.increment_run()
+        await sync.flush_run(run_number=run_number, metrics={...})
 
 =============================================================================
 """
 
 import os
 import json
+import asyncio
+import base64
+import gzip
+import hashlib
+import importlib.util
 import logging
+import mmap
+import random
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Tuple, TypeVar, Union
 from pathlib import Path
 
 try:
-    from github import Github, GithubException
+    from github import Github, GithubException, InputGitTreeElement
     from github.Repository import Repository
+    from urllib3.util.retry import Retry
 except ImportError:
     raise ImportError(
         "PyGithub not installed. Run: pip install PyGithub"
     )
 
+try:
+    import httpx
+except ImportError:
+    httpx = None  # AsyncGitHubSync, 조건부 요청 사용 시에만 필요
+
+# HTTP/2는 h2 패키지가 있을 때만 사용 (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # 없으면 표준 json 사용
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # Windows: 프로세스 간 잠금 없이 동작
+
+GITHUB_API_URL = "https://api.github.com"
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# 커밋 대기열 파일 내용 (str: 텍스트, bytes: 바이너리, None: 삭제)
+FileContent = Optional[Union[str, bytes]]
+
+# 이 길이를 넘는 실행 로그는 gzip 압축하여 커밋
+LOG_COMPRESS_THRESHOLD = 4096
+
+# 성능 대시보드 CSV와 실행별 행 파일 디렉토리
+DASHBOARD_FILE = "performance/metrics_history.csv"
+DASHBOARD_ROWS_DIR = "performance/rows"
+
+# 업로드한 blob SHA 캐시 크기 (LRU)
+BLOB_CACHE_SIZE = 1024
+
+# 실행 횟수 파일: 15자리 0-패딩 ASCII 정수 + 개행 (고정 16바이트)
+RUN_COUNT_DIGITS = 15
+RUN_COUNT_SIZE = RUN_COUNT_DIGITS + 1
+
+# 재시도 대상 응답 코드 (rate limit / 일시 장애)
+RETRYABLE_STATUSES = (403, 429, 502, 503)
+MAX_RETRY_ATTEMPTS = 5
+MAX_RETRY_DELAY = 120.0
+
+# 분기 커밋 SHA와 해당 커밋의 파일 blob SHA를 한 번에 조회
+HEAD_AND_FILE_QUERY = """
+query($owner: String!, $name: String!, $ref: String!, $path: String!) {
+  repository(owner: $owner, name: $name) {
+    ref(qualifiedName: $ref) {
+      target {
+        oid
+        ... on Commit { file(path: $path) { oid } }
+      }
+    }
+  }
+}
+"""
+
+# 파일 blob SHA만 조회 (내용은 받지 않음)
+BLOB_OID_QUERY = """
+query($owner: String!, $name: String!, $expression: String!) {
+  repository(owner: $owner, name: $name) {
+    object(expression: $expression) { oid }
+  }
+}
+"""
+
+# 디렉토리의 파일 목록과 내용을 한 번에 조회
+TREE_BLOBS_QUERY = """
+query($owner: String!, $name: String!, $expression: String!) {
+  repository(owner: $owner, name: $name) {
+    object(expression: $expression) {
+      ... on Tree { entries { name object { ... on Blob { text } } } }
+    }
+  }
+}
+"""
+
+# 성능 저하 이슈 본문
+ISSUE_BODY_TEMPLATE = """
+## 성능 저하 감지
+
+**기준 점수**: {baseline:.4f}
+**현재 점수**: {current:.4f}
+**저하율**: {degradation:.2f}%
+
+### 확인 필요 사항
+
+1. 최근 프롬프트 변경사항 검토
+2. 벤치마크 로그 확인
+3. 필요시 롤백 고려
+
+### 자동 조치
+
+- 시스템은 자동으로 이전 버전으로 롤백되었습니다.
+- 성능 로그: `logs/execution_latest.json`
+- 벤치마크 결과: `benchmarks/results_latest.json`
+
+---
+
+*이 이슈는 자동으로 생성되었습니다.*
+"""
+
+# 자동 최적화 PR 본문
+PR_BODY_TEMPLATE = """
+## 자동 최적화 결과
+
+이 PR은 성능 분석 기반으로 자동 생성되었습니다.
+
+### 성능 개선
+
+- **벤치마크 점수**: {benchmark_score}
+- **토큰 효율**: {token_efficiency}
+- **실행 시간**: {execution_time}
+
+### 변경 사항
+
+- 프롬프트 최적화
+- 메모리 관리 개선
+- 토큰 절감 기법 적용
+
+### 테스트 결과
+
+✅ OpenEnv-Turing 벤치마크 통과
+✅ 성능 회귀 테스트 통과
+
+---
+
+*이 PR은 자동으로 생성되었습니다. 리뷰 후 병합하세요.*
+"""
+
+
+def _git_blob_sha(data: bytes) -> str:
+    """Git blob 해시 (서버가 계산하는 blob SHA와 동일)"""
+    return hashlib.sha1(b"blob %d\x00" % len(data) + data).hexdigest()
+
+
+def _dumps(obj: Any) -> str:
+    """
+    JSON 직렬화 (indent=2, orjson 설치 시 orjson 사용)
+    
+    orjson이 처리하지 못하는 값(float 하위 클래스, 64비트 초과 정수 등)은
+    표준 json으로 직렬화
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, indent=2)
+
 
 class GitHubSync:
     """
@@ -84,25 +255,332 @@ class GitHubSync:
             raise ValueError(
                 "GitHub token required. Set GITHUB_TOKEN env var or pass token param."
             )
+        self._token = token
+        
+        # keep-alive 커넥션 풀 재사용 (호출마다 TLS 핸드셰이크 방지)
+        # 재시도 후에도 5xx이면 RetryError 대신 응답을 그대로 넘겨
+        # PyGithub가 GithubException으로 변환하도록 함
+        self.gh = Github(
+            token,
+            pool_size=16,
+            retry=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504],
+                raise_on_status=False
+            )
+        )
+        # lazy: 실제 API 호출 전까지 GET /repos/{owner}/{repo} 생략
+        self.repo: Repository = self.gh.get_repo(repo, lazy=True)
+        
+        # 마지막으로 커밋한 브랜치 HEAD SHA (get_branch 호출 생략용)
+        self._head_sha: Optional[str] = None
         
-        self.gh = Github(token)
-        self.repo: Repository = self.gh.get_repo(repo)
+        # REST 직접 호출용 keep-alive 클라이언트 (httpx 설치 시)
+        self._http: Optional["httpx.Client"] = None
+        if httpx is not None:
+            self._http = httpx.Client(
+                base_url=GITHUB_API_URL,
+                headers=self._api_headers()
+            )
         
         # 실행 횟수 추적
+        self._open_run_counter()
         self.run_count = self._load_run_count()
+        self._stamp_run()
+        
+        # 마지막으로 커밋한 대시보드 CSV (blob SHA, 내용) 캐시
+        cache = self._load_dashboard_cache()
+        self._dashboard_sha: Optional[str] = cache.get("sha")
+        self._dashboard_cached_content: Optional[str] = cache.get("content")
+        
+        # 다음 flush에서 대시보드 압축 여부 (압축 커밋 성공 시 해제)
+        self._compaction_due = False
+        
+        # 커밋 대기열 (경로 → 내용, None이면 삭제), flush 시 단일 커밋으로 반영
+        self._pending_files: Dict[str, FileContent] = {}
+        self._pending_messages: List[str] = []
+        
+        # 마지막 flush 이후 이 인스턴스가 대기열에 넣은 실행 수
+        # (실행 횟수 파일은 워커 간 공유되므로 커밋 주기 판단에 사용하지 않음)
+        self._queued_runs = 0
+        
+        # 이미 업로드한 blob SHA (같은 내용이면 create_git_blob 생략)
+        self._uploaded_blobs: "OrderedDict[str, None]" = OrderedDict()
+        
+        logger.info("✅ GitHub Sync initialized: %s (branch: %s)", repo, branch)
+    
+    def _open_run_counter(self):
+        """
+        실행 횟수 파일을 한 번만 열어 mmap으로 매핑
+        
+        이후 읽기/쓰기는 메모리 접근만으로 처리되어 실행마다
+        open/read/write/close가 발생하지 않고, 고정 폭이라 부분 쓰기도 없음
+        """
+        self._run_count_fd = os.open(
+            ".github_run_count", os.O_RDWR | os.O_CREAT, 0o644
+        )
+        
+        # 새 파일이거나 기존 가변 길이 형식이면 고정 폭으로 변환
+        with self._run_count_lock():
+            data = os.read(self._run_count_fd, RUN_COUNT_SIZE + 1)
+            if len(data) != RUN_COUNT_SIZE:
+                count = int(data.strip() or 0)
+                os.ftruncate(self._run_count_fd, RUN_COUNT_SIZE)
+                os.lseek(self._run_count_fd, 0, os.SEEK_SET)
+                os.write(self._run_count_fd, b"%0*d\n" % (RUN_COUNT_DIGITS, count))
         
-        logger.info(f"✅ GitHub Sync initialized: {repo} (branch: {branch})")
+        self._run_counter = mmap.mmap(self._run_count_fd, RUN_COUNT_SIZE)
+    
+    def __enter__(self) -> "GitHubSync":
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def close(self):
+        """
+        남은 대기열을 커밋한 뒤 리소스 정리
+        
+        대기열은 메모리에만 있으므로 프로세스 종료 전에 반드시 호출
+        (with 문 사용 시 자동 호출)
+        """
+        self.flush()
+        self._close_resources()
+    
+    def _close_resources(self):
+        """HTTP 클라이언트와 실행 횟수 파일 mmap/디스크립터 닫기"""
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+        if not self._run_counter.closed:
+            self._run_counter.close()
+            os.close(self._run_count_fd)
+    
+    @contextmanager
+    def _run_count_lock(self):
+        """실행 횟수 파일 잠금 (동시에 실행되는 워커 간 경합 방지)"""
+        if fcntl is None:
+            yield
+            return
+        fcntl.flock(self._run_count_fd, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._run_count_fd, fcntl.LOCK_UN)
     
     def _load_run_count(self) -> int:
-        """로컬에서 실행 횟수 로드"""
-        count_file = Path(".github_run_count")
-        if count_file.exists():
-            return int(count_file.read_text())
-        return 0
+        """mmap에서 실행 횟수 로드"""
+        return int(self._run_counter[:RUN_COUNT_DIGITS])
     
     def _save_run_count(self):
-        """실행 횟수 저장"""
-        Path(".github_run_count").write_text(str(self.run_count))
+        """mmap에 실행 횟수 저장 (커널이 페이지 캐시를 비동기로 기록)"""
+        self._run_counter[:RUN_COUNT_DIGITS] = b"%0*d" % (RUN_COUNT_DIGITS, self.run_count)
+    
+    def _load_dashboard_cache(self) -> Dict[str, Optional[str]]:
+        """로컬에서 대시보드 CSV 캐시 로드"""
+        cache_file = Path(".github_dashboard_cache.json")
+        if cache_file.exists():
+            return json.loads(cache_file.read_text())
+        return {}
+    
+    def _save_dashboard_cache(self):
+        """대시보드 CSV 캐시 저장"""
+        Path(".github_dashboard_cache.json").write_text(json.dumps({
+            "sha": self._dashboard_sha,
+            "content": self._dashboard_cached_content
+        }))
+    
+    def _api_headers(self) -> Dict[str, str]:
+        """REST API 직접 호출용 공통 헤더"""
+        return {
+            "Authorization": f"Bearer {self._token}",
+            "Accept": "application/vnd.github+json"
+        }
+    
+    def _http_request(self, method: str, url: str, **kwargs) -> "httpx.Response":
+        """
+        HTTP 클라이언트 요청
+        
+        연결/타임아웃 등 전송 오류는 일시적 오류로 보고
+        GithubException(503)으로 변환하여 백오프 재시도 대상이 되도록 함
+        """
+        try:
+            return self._http.request(method, url, **kwargs)
+        except httpx.HTTPError as e:
+            raise GithubException(503, {"message": str(e)}, {}) from e
+    
+    def _fetch_dashboard(self, filename: str, ref: str) -> str:
+        """
+        대시보드 CSV 조회
+        
+        마지막으로 커밋한 CSV를 blob SHA와 함께 캐시해 두고, ref의 파일
+        SHA만 GraphQL로 조회하여 같으면 내용을 다시 받지 않음
+        (다른 워커가 압축하지 않았다면 CSV는 이 인스턴스가 쓴 그대로)
+        
+        Args:
+            filename: 대시보드 파일 경로
+            ref: 조회할 커밋 SHA
+            
+        Returns:
+            CSV 내용
+            
+        Raises:
+            GithubException: 파일이 없거나 조회 실패 시
+        """
+        if self._http is None:
+            file = self.repo.get_contents(filename, ref=ref)
+            return file.decoded_content.decode('utf-8')
+        
+        if self._dashboard_cached_content is not None:
+            data = self._gql(BLOB_OID_QUERY, {"expression": f"{ref}:{filename}"})
+            blob = (data.get("repository") or {}).get("object")
+            if blob is None:
+                raise GithubException(
+                    404, {"message": f"File not found: {filename}"}, {}
+                )
+            if blob["oid"] == self._dashboard_sha:
+                return self._dashboard_cached_content
+        
+        response = self._http_request(
+            "GET",
+            f"/repos/{self.repo_name}/contents/{filename}",
+            params={"ref": ref},
+            headers={"Accept": "application/vnd.github.raw"}
+        )
+        if response.status_code != 200:
+            raise GithubException(
+                response.status_code, response.text, dict(response.headers)
+            )
+        return response.text
+    
+    def _cache_dashboard(self, content: str):
+        """커밋한 대시보드 CSV 내용과 blob SHA 캐시"""
+        self._dashboard_sha = _git_blob_sha(content.encode("utf-8"))
+        self._dashboard_cached_content = content
+        self._save_dashboard_cache()
+    
+    def _stamp_run(self):
+        """
+        실행 단위 타임스탬프 갱신
+        
+        파일명에는 나노초 정수를, 본문/커밋 메시지에는 ISO 문자열을 사용하며
+        실행마다 한 번만 계산
+        """
+        self._run_stamp_ns = time.time_ns()
+        self._run_timestamp = datetime.fromtimestamp(
+            self._run_stamp_ns / 1e9
+        ).isoformat()
+        self._file_seq = 0
+    
+    def _file_stamp(self) -> str:
+        """
+        호출마다 고유한 파일명 접미사 (실행 스탬프 + 실행 내 순번)
+        
+        같은 실행에서 로그/벤치마크를 여러 번 기록해도 덮어쓰지 않도록 함
+        """
+        self._file_seq += 1
+        return f"{self._run_stamp_ns}_{self._file_seq}"
+    
+    @staticmethod
+    def _is_retryable(status: int, headers: Dict[str, str]) -> bool:
+        """
+        재시도 여부 판단
+        
+        403은 rate limit에 걸린 경우(Retry-After 또는 잔여 횟수 0)만 재시도
+        """
+        if status not in RETRYABLE_STATUSES:
+            return False
+        if status == 403:
+            return (
+                "retry-after" in headers
+                or headers.get("x-ratelimit-remaining") == "0"
+            )
+        return True
+    
+    @staticmethod
+    def _retry_delay(headers: Dict[str, str], attempt: int) -> float:
+        """
+        재시도 대기 시간 계산
+        
+        Retry-After → X-RateLimit-Reset (잔여 횟수 0일 때만) → 지수 백오프 순으로
+        결정하고, 최소 30초 + 지터, 최대 MAX_RETRY_DELAY초
+        """
+        if "retry-after" in headers:
+            wait = float(headers["retry-after"])
+        elif (
+            headers.get("x-ratelimit-remaining") == "0"
+            and "x-ratelimit-reset" in headers
+        ):
+            wait = float(headers["x-ratelimit-reset"]) - time.time()
+        else:
+            wait = 30 * 2 ** attempt
+        return min(max(wait, 30) + random.uniform(0, 5), MAX_RETRY_DELAY)
+    
+    def _call_with_backoff(self, fn: Callable[..., T], *args, **kwargs) -> T:
+        """
+        GitHub API 호출 (rate limit/일시 장애 시 백오프 후 재시도)
+        
+        Args:
+            fn: 호출할 PyGithub 메서드
+            *args, **kwargs: fn 인자
+            
+        Returns:
+            fn 반환값
+            
+        Raises:
+            GithubException: 재시도 대상이 아니거나 재시도 횟수 초과 시
+        """
+        for attempt in range(MAX_RETRY_ATTEMPTS):
+            try:
+                return fn(*args, **kwargs)
+            except GithubException as e:
+                headers = {k.lower(): v for k, v in (e.headers or {}).items()}
+                if (
+                    not self._is_retryable(e.status, headers)
+                    or attempt == MAX_RETRY_ATTEMPTS - 1
+                ):
+                    raise
+                delay = self._retry_delay(headers, attempt)
+                logger.warning(
+                    "⏳ GitHub API %s, retrying in %.0fs (%d/%d)",
+                    e.status, delay, attempt + 1, MAX_RETRY_ATTEMPTS
+                )
+                time.sleep(delay)
+    
+    def _gql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        GraphQL API 호출
+        
+        Args:
+            query: GraphQL 쿼리
+            variables: 쿼리 변수 (owner/name은 자동 추가)
+            
+        Returns:
+            응답의 data 필드
+            
+        Raises:
+            GithubException: 요청 실패 또는 GraphQL 오류 시
+        """
+        owner, name = self.repo_name.split("/", 1)
+        response = self._http_request(
+            "POST",
+            "/graphql",
+            json={
+                "query": query,
+                "variables": {"owner": owner, "name": name, **variables}
+            }
+        )
+        try:
+            body = response.json() if response.content else None
+        except ValueError:
+            # 프록시의 502/503 HTML 등 JSON이 아닌 응답
+            body = None
+        if response.status_code != 200 or not body or body.get("errors"):
+            raise GithubException(
+                response.status_code, body, dict(response.headers)
+            )
+        return body["data"]
     
     def increment_run(self) -> int:
         """
@@ -111,15 +589,145 @@ class GitHubSync:
         Returns:
             현재 실행 번호
         """
-        self.run_count += 1
-        self._save_run_count()
-        logger.info(f"📊 Run #{self.run_count}")
+        # 커밋 주기만큼 실행이 쌓였으면 한 번에 커밋
+        if self._should_flush():
+            self.flush()
+        
+        # 다른 워커가 증가시킨 값을 반영하도록 잠금 후 다시 읽기
+        with self._run_count_lock():
+            self.run_count = self._load_run_count() + 1
+            self._save_run_count()
+        self._stamp_run()
+        logger.info("📊 Run #%d", self.run_count)
         return self.run_count
     
     def should_commit(self) -> bool:
         """커밋 여부 판단"""
         return self.auto_commit and (self.run_count % self.commit_interval == 0)
     
+    def _window_full(self) -> bool:
+        """마지막 flush 이후 이 인스턴스가 N회분 로그를 모았는지"""
+        return self._queued_runs >= self.commit_interval
+    
+    def _should_flush(self) -> bool:
+        """대기열 반영 여부 판단 (auto_commit이면 N회마다, 아니면 매 실행)"""
+        return not self.auto_commit or self._window_full()
+    
+    def _enqueue(self, path: str, content: Union[str, bytes], message: str):
+        """커밋 대기열에 파일 추가"""
+        self._pending_files[path] = content
+        self._pending_messages.append(message)
+    
+    def _clear_pending(self):
+        """커밋 대기열 비우기"""
+        self._pending_files = {}
+        self._pending_messages = []
+        self._queued_runs = 0
+    
+    @staticmethod
+    def _blob_payload(content: Union[str, bytes]) -> Tuple[str, str]:
+        """blob 생성 인자 (내용, 인코딩) - 바이너리는 base64로 전송"""
+        if isinstance(content, bytes):
+            return base64.b64encode(content).decode("ascii"), "base64"
+        return content, "utf-8"
+    
+    def _known_blob(self, content: Union[str, bytes]) -> Optional[str]:
+        """이미 업로드한 내용이면 그 blob SHA 반환"""
+        data = content if isinstance(content, bytes) else content.encode("utf-8")
+        sha = _git_blob_sha(data)
+        if sha not in self._uploaded_blobs:
+            return None
+        self._uploaded_blobs.move_to_end(sha)
+        return sha
+    
+    def _remember_blob(self, sha: str):
+        """업로드한 blob SHA 기록 (오래된 항목부터 제거)"""
+        self._uploaded_blobs[sha] = None
+        if len(self._uploaded_blobs) > BLOB_CACHE_SIZE:
+            self._uploaded_blobs.popitem(last=False)
+    
+    def _upload_blob(self, content: FileContent) -> Optional[str]:
+        """blob 업로드 후 SHA 반환 (삭제 항목은 None, 업로드한 적 있는 내용은 재사용)"""
+        if content is None:
+            return None
+        sha = self._known_blob(content)
+        if sha is None:
+            sha = self._call_with_backoff(
+                self.repo.create_git_blob, *self._blob_payload(content)
+            ).sha
+            self._remember_blob(sha)
+        return sha
+    
+    def _batch_commit(self, files: Dict[str, FileContent], message: str) -> str:
+        """
+        Git Data API로 여러 파일을 하나의 커밋으로 반영
+        
+        파일마다 create_file을 호출하는 대신 blob → tree → commit → ref
+        순서로 처리하여 파일 수와 무관하게 커밋 1개만 생성
+        
+        Args:
+            files: 경로 → 내용 (None이면 삭제)
+            message: 커밋 메시지
+            
+        Returns:
+            새 커밋 SHA
+        """
+        call = self._call_with_backoff
+        
+        ref = call(self.repo.get_git_ref, f"heads/{self.branch}")
+        compaction = (
+            self._compact_dashboard(files, ref.object.sha)
+            if self._compaction_due else None
+        )
+        if compaction is not None:
+            files, note = compaction
+            message = f"{message}\n\n{note}"
+        parent = call(self.repo.get_git_commit, ref.object.sha)
+        
+        tree_elements = [
+            InputGitTreeElement(
+                path=path,
+                mode="100644",
+                type="blob",
+                sha=self._upload_blob(content)  # sha=None → 파일 삭제
+            )
+            for path, content in files.items()
+        ]
+        
+        tree = call(self.repo.create_git_tree, tree_elements, base_tree=parent.tree)
+        commit = call(self.repo.create_git_commit, message, tree, [parent])
+        call(ref.edit, commit.sha)
+        self._head_sha = commit.sha
+        if compaction is not None:
+            self._compaction_due = False
+            self._cache_dashboard(files[DASHBOARD_FILE])
+        return commit.sha
+    
+    def flush(self) -> Optional[str]:
+        """
+        대기 중인 파일을 단일 커밋으로 반영
+        
+        Returns:
+            커밋 SHA 또는 None
+        """
+        if not self._pending_files:
+            return None
+        
+        files = self._pending_files
+        message = "\n\n".join(self._pending_messages)
+        
+        try:
+            sha = self._batch_commit(files, message)
+        except GithubException as e:
+            # 대기열은 유지하여 다음 flush에서 재시도
+            logger.error("❌ Batch commit failed: %s", e)
+            return None
+        
+        self._clear_pending()
+        
+        logger.info("✅ Committed %d file(s) (SHA: %.7s)", len(files), sha)
+        return sha
+    
     def commit_execution_log(
         self,
         run_number: int,
@@ -127,7 +735,10 @@ class GitHubSync:
         log_content: str = ""
     ) -> Optional[str]:
         """
-        실행 로그를 GitHub에 커밋
+        실행 로그를 커밋 대기열에 추가
+        
+        커밋 주기 사이의 실행 로그도 메모리에 모아 두었다가
+        N번째 실행 후 flush 시 한 커밋으로 반영
         
         Args:
             run_number: 실행 번호
@@ -135,14 +746,14 @@ class GitHubSync:
             log_content: 로그 내용
             
         Returns:
-            커밋 SHA 또는 None
+            대기열에 추가된 파일 경로 또는 None
         """
-        if not self.should_commit():
-            logger.info(f"⏸️ Skipping commit (interval: {self.commit_interval})")
+        if not self.auto_commit:
+            logger.info("⏸️ Skipping commit (auto_commit disabled)")
             return None
         
-        timestamp = datetime.now().isoformat()
-        filename = f"logs/execution_{run_number}_{timestamp}.json"
+        timestamp = self._run_timestamp
+        filename = f"logs/execution_{run_number}_{self._file_stamp()}.json"
         
         content = {
             "run_number": run_number,
@@ -151,120 +762,165 @@ class GitHubSync:
             "log": log_content
         }
         
-        try:
-            # 파일 생성/업데이트
-            message = (
-                f"📊 Auto-commit: Run #{run_number}\n\n"
-                f"- Benchmark Score: {metrics.get('benchmark_score', 'N/A')}\n"
-                f"- Token Efficiency: {metrics.get('token_efficiency', 'N/A')}\n"
-                f"- Execution Time: {metrics.get('execution_time', 'N/A')}\n"
-                f"- Forgetting Score: {metrics.get('forgetting_score', 'N/A')}"
-            )
-            
-            # GitHub API로 커밋
-            result = self.repo.create_file(
-                path=filename,
-                message=message,
-                content=json.dumps(content, indent=2),
-                branch=self.branch
-            )
-            
-            logger.info(f"✅ Committed: {filename} (SHA: {result['commit'].sha[:7]})")
-            return result['commit'].sha
-            
-        except GithubException as e:
-            logger.error(f"❌ Commit failed: {e}")
-            return None
+        bs, te, et, fs = (
+            metrics.get(k, "N/A")
+            for k in ("benchmark_score", "token_efficiency", "execution_time", "forgetting_score")
+        )
+        message = (
+            f"📊 Auto-commit: Run #{run_number}\n\n"
+            f"- Benchmark Score: {bs}\n"
+            f"- Token Efficiency: {te}\n"
+            f"- Execution Time: {et}\n"
+            f"- Forgetting Score: {fs}"
+        )
+        
+        # 큰 로그는 gzip 압축
+        if len(log_content) > LOG_COMPRESS_THRESHOLD:
+            filename += ".gz"
+            payload = gzip.compress(_dumps(content).encode("utf-8"), mtime=0)
+        else:
+            payload = _dumps(content)
+        
+        self._enqueue(filename, payload, message)
+        self._queued_runs += 1
+        
+        logger.info("📝 Queued: %s", filename)
+        return filename
     
     def commit_benchmark_results(
         self,
         results: Dict[str, Any]
-    ) -> Optional[str]:
+    ) -> str:
         """
-        벤치마크 결과를 GitHub에 커밋
+        벤치마크 결과를 커밋 대기열에 추가 (flush 시 커밋)
         
         Args:
             results: 벤치마크 결과
             
         Returns:
-            커밋 SHA 또는 None
+            대기열에 추가된 파일 경로
         """
-        timestamp = datetime.now().isoformat()
-        filename = f"benchmarks/results_{timestamp}.json"
+        filename = f"benchmarks/results_{self.run_count}_{self._file_stamp()}.json"
         
-        try:
-            message = (
-                f"🏆 Benchmark Results\n\n"
-                f"- Overall Score: {results.get('overall_score', 'N/A')}\n"
-                f"- Pass Rate: {results.get('pass_rate', 'N/A')}\n"
-                f"- Token Efficiency: {results.get('token_efficiency', 'N/A')}"
-            )
-            
-            result = self.repo.create_file(
-                path=filename,
-                message=message,
-                content=json.dumps(results, indent=2),
-                branch=self.branch
-            )
-            
-            logger.info(f"✅ Benchmark committed: {filename}")
-            return result['commit'].sha
-            
-        except GithubException as e:
-            logger.error(f"❌ Benchmark commit failed: {e}")
-            return None
+        overall, pass_rate, te = (
+            results.get(k, "N/A")
+            for k in ("overall_score", "pass_rate", "token_efficiency")
+        )
+        message = (
+            f"🏆 Benchmark Results\n\n"
+            f"- Overall Score: {overall}\n"
+            f"- Pass Rate: {pass_rate}\n"
+            f"- Token Efficiency: {te}"
+        )
+        
+        self._enqueue(filename, _dumps(results), message)
+        
+        logger.info("📝 Benchmark queued: %s", filename)
+        return filename
     
     def update_performance_dashboard(
         self,
         metrics: Dict[str, float]
-    ) -> Optional[str]:
+    ) -> str:
         """
-        성능 대시보드 CSV 업데이트
+        성능 대시보드 행을 커밋 대기열에 추가 (flush 시 커밋)
+        
+        실행마다 전체 CSV를 다시 올리지 않도록 행 하나를
+        performance/rows/ 아래 개별 파일로 기록하고,
+        commit_interval * 10회마다 metrics_history.csv로 압축
         
         Args:
             metrics: 성능 메트릭
             
         Returns:
-            커밋 SHA 또는 None
+            대기열에 추가된 행 파일 경로
         """
-        filename = "performance/metrics_history.csv"
-        timestamp = datetime.now().isoformat()
+        timestamp = self._run_timestamp
         
         # CSV 행 생성
-        row = f"{timestamp},{metrics.get('benchmark_score', 0)},{metrics.get('token_usage', 0)},{metrics.get('execution_time', 0)},{metrics.get('forgetting_score', 0)}\n"
+        row = ",".join([timestamp, *(
+            str(metrics.get(k, 0))
+            for k in ("benchmark_score", "token_usage", "execution_time", "forgetting_score")
+        )]) + "\n"
+        row_file = f"{DASHBOARD_ROWS_DIR}/{self._run_stamp_ns}.csv"
+        
+        # 같은 실행에서 여러 번 호출되면 같은 행 파일에 이어 붙이기
+        pending_rows = self._pending_files.get(row_file)
+        if pending_rows is not None:
+            row = pending_rows + row
+        
+        self._enqueue(row_file, row, f"📊 Update performance metrics: {timestamp}")
+        logger.info("📝 Dashboard row queued: %s", row_file)
+        
+        # 압축은 flush 시 커밋할 부모 커밋 기준으로 수행 (_compact_dashboard)
+        compact_interval = self.commit_interval * 10
+        if self.run_count and self.run_count % compact_interval == 0:
+            self._compaction_due = True
+        
+        return row_file
+    
+    def _compact_dashboard(
+        self,
+        files: Dict[str, FileContent],
+        base_sha: str
+    ) -> Optional[Tuple[Dict[str, FileContent], str]]:
+        """
+        커밋할 파일에 대시보드 압축 반영 (행 파일 → metrics_history.csv)
+        
+        커밋된 행과 CSV를 새 커밋의 부모(base_sha)에서 읽으므로 읽은 내용과
+        쓰는 위치가 일치함. 그 사이 다른 워커가 브랜치를 옮기면 ref 갱신이
+        fast-forward가 아니어서 실패하고, 다음 flush에서 새 부모 기준으로 다시 압축
+        
+        Args:
+            files: 커밋할 파일 (경로 → 내용)
+            base_sha: 부모 커밋 SHA
+            
+        Returns:
+            (압축이 반영된 파일, 커밋 메시지) 또는 조회 실패 시 None
+        """
+        filename = DASHBOARD_FILE
+        rows_dir = DASHBOARD_ROWS_DIR
         
         try:
+            # 이미 커밋된 행 파일
+            committed = self._call_with_backoff(
+                self._fetch_committed_rows, rows_dir, base_sha
+            )
+            
             # 기존 파일 가져오기
             try:
-                file = self.repo.get_contents(filename, ref=self.branch)
-                content = file.decoded_content.decode('utf-8')
-                new_content = content + row
-                sha = file.sha
-                
-                # 업데이트
-                result = self.repo.update_file(
-                    path=filename,
-                    message=f"📊 Update performance metrics: {timestamp}",
-                    content=new_content,
-                    sha=sha,
-                    branch=self.branch
+                content = self._call_with_backoff(
+                    self._fetch_dashboard, filename, base_sha
                 )
-            except:
+            except GithubException as e:
+                if e.status != 404:
+                    raise
                 # 파일 없으면 생성
-                header = "timestamp,benchmark_score,token_usage,execution_time,forgetting_score\n"
-                result = self.repo.create_file(
-                    path=filename,
-                    message=f"🆕 Initialize performance dashboard",
-                    content=header + row,
-                    branch=self.branch
-                )
-            
-            logger.info(f"✅ Dashboard updated: {filename}")
-            return result['commit'].sha
-            
+                content = "timestamp,benchmark_score,token_usage,execution_time,forgetting_score\n"
         except GithubException as e:
-            logger.error(f"❌ Dashboard update failed: {e}")
+            # 행 파일은 그대로 커밋되므로 다음 flush에서 다시 합쳐짐
+            logger.error("❌ Dashboard compaction failed: %s", e)
             return None
+        
+        # 아직 커밋되지 않은 행 (같은 실행의 행 파일이 이미 커밋됐으면 뒤에 이어 붙임)
+        pending_rows = [
+            path for path, row in files.items()
+            if path.startswith(f"{rows_dir}/") and row is not None
+        ]
+        rows = dict(committed)
+        for path in pending_rows:
+            rows[path] = rows.get(path, "") + files[path]
+        
+        # 파일명이 타임스탬프이므로 정렬 순서가 곧 시간 순서
+        compacted = {
+            path: row for path, row in files.items() if path not in pending_rows
+        }
+        compacted[filename] = content + "".join(rows[path] for path in sorted(rows))
+        for path in committed:
+            compacted[path] = None  # 삭제
+        
+        logger.info("🗜️ Dashboard compaction: %d row(s)", len(rows))
+        return compacted, f"🗜️ Compact performance metrics: {len(rows)} row(s)"
     
     def create_performance_issue_if_degraded(
         self,
@@ -289,45 +945,64 @@ class GitHubSync:
         degradation = (baseline - current) / baseline * 100
         
         title = f"⚠️ Performance Degradation Detected: {degradation:.1f}% drop"
-        body = f"""
-## 성능 저하 감지
-
-**기준 점수**: {baseline:.4f}
-**현재 점수**: {current:.4f}
-**저하율**: {degradation:.2f}%
-
-### 확인 필요 사항
-
-1. 최근 프롬프트 변경사항 검토
-2. 벤치마크 로그 확인
-3. 필요시 롤백 고려
-
-### 자동 조치
-
-- 시스템은 자동으로 이전 버전으로 롤백되었습니다.
-- 성능 로그: `logs/execution_latest.json`
-- 벤치마크 결과: `benchmarks/results_latest.json`
-
----
-
-*이 이슈는 자동으로 생성되었습니다.*
-        """
+        body = ISSUE_BODY_TEMPLATE.format_map({
+            "baseline": baseline,
+            "current": current,
+            "degradation": degradation
+        })
         
         try:
-            issue = self.repo.create_issue(
+            issue = self._call_with_backoff(
+                self.repo.create_issue,
                 title=title,
                 body=body,
                 labels=["bug", "auto-generated", "priority-high"],
                 assignees=["GilbertKwak"]
             )
             
-            logger.warning(f"⚠️ Issue created: #{issue.number} - {title}")
+            logger.warning("⚠️ Issue created: #%d - %s", issue.number, title)
             return issue.number
             
         except GithubException as e:
-            logger.error(f"❌ Issue creation failed: {e}")
+            logger.error("❌ Issue creation failed: %s", e)
             return None
     
+    def _fetch_committed_rows(self, rows_dir: str, ref: str) -> Dict[str, str]:
+        """
+        커밋된 행 파일 조회
+        
+        httpx가 있으면 GraphQL 한 번으로 목록과 내용을 함께 가져오고,
+        없으면 목록 조회 후 파일별로 내용을 가져옴
+        
+        Args:
+            rows_dir: 행 파일 디렉토리
+            ref: 조회할 커밋 SHA
+            
+        Returns:
+            경로 → 행 내용
+        """
+        if self._http is not None:
+            data = self._gql(
+                TREE_BLOBS_QUERY,
+                {"expression": f"{ref}:{rows_dir}"}
+            )
+            tree = data["repository"]["object"] or {}
+            return {
+                f"{rows_dir}/{entry['name']}": entry["object"]["text"]
+                for entry in tree.get("entries", [])
+            }
+        
+        try:
+            files = self.repo.get_contents(rows_dir, ref=ref)
+        except GithubException as e:
+            if e.status != 404:
+                raise
+            return {}
+        return {
+            file.path: file.decoded_content.decode('utf-8')
+            for file in files
+        }
+    
     def create_optimization_pull_request(
         self,
         optimized_prompt: str,
@@ -346,58 +1021,82 @@ class GitHubSync:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         branch_name = f"auto-optimize-{timestamp}"
         
+        prompt_path = "prompts/v4.0-complete-integration.xml"
+        
+        # 분기 기준 SHA는 읽기만 한 값이므로 캐시하지 않음
+        # (_head_sha는 _batch_commit이 직접 커밋한 SHA만 보관)
+        base_sha = self._head_sha
+        
         try:
-            # 새 브랜치 생성
-            base_branch = self.repo.get_branch(self.branch)
-            self.repo.create_git_ref(
-                ref=f"refs/heads/{branch_name}",
-                sha=base_branch.commit.sha
-            )
+            if base_sha is None and self._http is not None:
+                # GraphQL 한 번으로 분기 커밋 SHA와 파일 SHA 조회 후 브랜치 생성
+                data = self._call_with_backoff(
+                    self._gql,
+                    HEAD_AND_FILE_QUERY,
+                    {"ref": f"refs/heads/{self.branch}", "path": prompt_path}
+                )
+                repository = data.get("repository")
+                ref = repository and repository.get("ref")
+                if ref is None:
+                    raise GithubException(
+                        404, {"message": f"Branch not found: {self.branch}"}, {}
+                    )
+                target = ref["target"]
+                if target.get("file") is None:
+                    raise GithubException(
+                        404, {"message": f"File not found: {prompt_path}"}, {}
+                    )
+                base_sha = target["oid"]
+                file_sha = target["file"]["oid"]
+                
+                self._call_with_backoff(
+                    self.repo.create_git_ref,
+                    ref=f"refs/heads/{branch_name}",
+                    sha=base_sha
+                )
+            else:
+                # 새 브랜치 생성 (직전 커밋 SHA가 있으면 get_branch 생략)
+                if base_sha is None:
+                    base_branch = self._call_with_backoff(self.repo.get_branch, self.branch)
+                    base_sha = base_branch.commit.sha
+                
+                # 브랜치 생성과 파일 조회를 동시에 실행
+                # (새 브랜치 내용은 분기 커밋과 동일하므로 분기 커밋에서 조회)
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    ref_future = executor.submit(
+                        self._call_with_backoff,
+                        self.repo.create_git_ref,
+                        ref=f"refs/heads/{branch_name}",
+                        sha=base_sha
+                    )
+                    file_future = executor.submit(
+                        self._call_with_backoff,
+                        self.repo.get_contents,
+                        prompt_path,
+                        ref=base_sha
+                    )
+                    ref_future.result()
+                    file_sha = file_future.result().sha
             
             # 파일 업데이트
-            file = self.repo.get_contents(
-                "prompts/v4.0-complete-integration.xml",
-                ref=branch_name
-            )
-            
-            self.repo.update_file(
-                path=file.path,
+            self._call_with_backoff(
+                self.repo.update_file,
+                path=prompt_path,
                 message="✨ Auto-optimized prompt",
                 content=optimized_prompt,
-                sha=file.sha,
+                sha=file_sha,
                 branch=branch_name
             )
             
             # PR 생성
             title = f"✨ Auto-optimized prompt: {performance_improvement.get('improvement', 0):.1f}% better"
-            body = f"""
-## 자동 최적화 결과
-
-이 PR은 성능 분석 기반으로 자동 생성되었습니다.
-
-### 성능 개선
-
-- **벤치마크 점수**: {performance_improvement.get('benchmark_score', 'N/A')}
-- **토큰 효율**: {performance_improvement.get('token_efficiency', 'N/A')}
-- **실행 시간**: {performance_improvement.get('execution_time', 'N/A')}
-
-### 변경 사항
-
-- 프롬프트 최적화
-- 메모리 관리 개선
-- 토큰 절감 기법 적용
-
-### 테스트 결과
-
-✅ OpenEnv-Turing 벤치마크 통과
-✅ 성능 회귀 테스트 통과
-
----
-
-*이 PR은 자동으로 생성되었습니다. 리뷰 후 병합하세요.*
-            """
+            body = PR_BODY_TEMPLATE.format_map({
+                k: performance_improvement.get(k, "N/A")
+                for k in ("benchmark_score", "token_efficiency", "execution_time")
+            })
             
-            pr = self.repo.create_pull(
+            pr = self._call_with_backoff(
+                self.repo.create_pull,
                 title=title,
                 body=body,
                 head=branch_name,
@@ -405,36 +1104,229 @@ class GitHubSync:
             )
             
             # 리뷰어 할당
-            pr.create_review_request(reviewers=["GilbertKwak"])
+            self._call_with_backoff(pr.create_review_request, reviewers=["GilbertKwak"])
             
-            logger.info(f"✨ PR created: #{pr.number} - {title}")
+            logger.info("✨ PR created: #%d - %s", pr.number, title)
             return pr.number
             
         except GithubException as e:
-            logger.error(f"❌ PR creation failed: {e}")
+            logger.error("❌ PR creation failed: %s", e)
             return None
 
 
-if __name__ == "__main__":
-    # 테스트 실행
-    sync = GitHubSync(
-        repo="GilbertKwak/ai-multiagent-framework-v4",
-        commit_interval=10
-    )
+class AsyncGitHubSync(GitHubSync):
+    """
+    비동기 GitHub 동기화 클래스
     
-    # 실행 횟수 증가
-    run_num = sync.increment_run()
+    대기열 구성은 GitHubSync와 동일하며, flush 시 Git Data API를
+    httpx.AsyncClient로 직접 호출하여 blob 업로드를 동시에 실행
+    """
     
-    # 테스트 메트릭
-    test_metrics = {
-        "benchmark_score": 0.97,
-        "token_efficiency": 0.62,
-        "execution_time": "3.2 min",
-        "forgetting_score": 0.018
-    }
+    def __init__(self, *args, **kwargs):
+        if httpx is None:
+            raise ImportError(
+                "httpx not installed. Run: pip install httpx"
+            )
+        super().__init__(*args, **kwargs)
+        self._client: Optional["httpx.AsyncClient"] = None
+    
+    async def __aenter__(self) -> "AsyncGitHubSync":
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+    
+    def _get_client(self) -> "httpx.AsyncClient":
+        """keep-alive 클라이언트 (최초 사용 시 생성, h2 설치 시 HTTP/2)"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=f"{GITHUB_API_URL}/repos/{self.repo_name}",
+                headers=self._api_headers(),
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=16,
+                    max_keepalive_connections=16
+                )
+            )
+        return self._client
+    
+    async def aclose(self):
+        """
+        남은 대기열을 커밋한 뒤 비동기 HTTP 클라이언트와 상속된 리소스 정리
+        
+        (async with 문 사용 시 자동 호출)
+        """
+        await self.flush_async()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self._close_resources()
+    
+    async def _request(self, method: str, path: str, **kwargs) -> Dict[str, Any]:
+        """REST API 호출 후 JSON 응답 반환 (rate limit/일시 장애 시 백오프 재시도)"""
+        for attempt in range(MAX_RETRY_ATTEMPTS):
+            response = await self._get_client().request(method, path, **kwargs)
+            headers = {k.lower(): v for k, v in response.headers.items()}
+            if (
+                not self._is_retryable(response.status_code, headers)
+                or attempt == MAX_RETRY_ATTEMPTS - 1
+            ):
+                break
+            delay = self._retry_delay(headers, attempt)
+            logger.warning(
+                "⏳ GitHub API %s, retrying in %.0fs (%d/%d)",
+                response.status_code, delay, attempt + 1, MAX_RETRY_ATTEMPTS
+            )
+            await asyncio.sleep(delay)
+        
+        response.raise_for_status()
+        return response.json()
+    
+    async def _create_blob(self, content: FileContent) -> Optional[str]:
+        """blob 생성 후 SHA 반환 (삭제 항목은 None, 업로드한 적 있는 내용은 재사용)"""
+        if content is None:
+            return None
+        sha = self._known_blob(content)
+        if sha is not None:
+            return sha
+        payload, encoding = self._blob_payload(content)
+        blob = await self._request(
+            "POST", "/git/blobs",
+            json={"content": payload, "encoding": encoding}
+        )
+        self._remember_blob(blob["sha"])
+        return blob["sha"]
     
-    # 커밋 테스트
-    if sync.should_commit():
+    async def _batch_commit_async(
+        self,
+        files: Dict[str, FileContent],
+        message: str
+    ) -> str:
+        """
+        _batch_commit의 비동기 버전
+        
+        부모 커밋 조회와 모든 blob 업로드를 asyncio.gather로 동시에 실행
+        
+        Args:
+            files: 경로 → 내용 (None이면 삭제)
+            message: 커밋 메시지
+            
+        Returns:
+            새 커밋 SHA
+        """
+        ref = await self._request("GET", f"/git/ref/heads/{self.branch}")
+        parent_sha = ref["object"]["sha"]
+        
+        compaction = (
+            await asyncio.to_thread(self._compact_dashboard, files, parent_sha)
+            if self._compaction_due else None
+        )
+        if compaction is not None:
+            files, note = compaction
+            message = f"{message}\n\n{note}"
+        
+        parent, *blob_shas = await asyncio.gather(
+            self._request("GET", f"/git/commits/{parent_sha}"),
+            *(self._create_blob(content) for content in files.values())
+        )
+        
+        tree = await self._request(
+            "POST", "/git/trees",
+            json={
+                "base_tree": parent["tree"]["sha"],
+                "tree": [
+                    {"path": path, "mode": "100644", "type": "blob", "sha": sha}
+                    for path, sha in zip(files, blob_shas)
+                ]
+            }
+        )
+        commit = await self._request(
+            "POST", "/git/commits",
+            json={"message": message, "tree": tree["sha"], "parents": [parent_sha]}
+        )
+        await self._request(
+            "PATCH", f"/git/refs/heads/{self.branch}",
+            json={"sha": commit["sha"]}
+        )
+        self._head_sha = commit["sha"]
+        if compaction is not None:
+            self._compaction_due = False
+            self._cache_dashboard(files[DASHBOARD_FILE])
+        return commit["sha"]
+    
+    async def flush_async(self) -> Optional[str]:
+        """
+        대기 중인 파일을 단일 커밋으로 반영 (비동기)
+        
+        Returns:
+            커밋 SHA 또는 None
+        """
+        if not self._pending_files:
+            return None
+        
+        files = self._pending_files
+        message = "\n\n".join(self._pending_messages)
+        
+        try:
+            sha = await self._batch_commit_async(files, message)
+        except httpx.HTTPError as e:
+            # 대기열은 유지하여 다음 flush에서 재시도
+            logger.error("❌ Batch commit failed: %s", e)
+            return None
+        
+        self._clear_pending()
+        
+        logger.info("✅ Committed %d file(s) (SHA: %.7s)", len(files), sha)
+        return sha
+    
+    async def flush_run(
+        self,
+        run_number: int,
+        metrics: Dict[str, Any],
+        log_content: str = "",
+        benchmark_results: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
+        """
+        한 실행의 로그/벤치마크/대시보드를 대기열에 추가하고,
+        커밋 주기이면 쌓인 파일 전체를 단일 커밋으로 반영
+        
+        Args:
+            run_number: 실행 번호
+            metrics: 성능 메트릭
+            log_content: 로그 내용
+            benchmark_results: 벤치마크 결과 (선택)
+            
+        Returns:
+            커밋 SHA 또는 None (커밋 주기가 아니면 None)
+        """
+        self.commit_execution_log(run_number, metrics, log_content)
+        if benchmark_results is not None:
+            self.commit_benchmark_results(benchmark_results)
+        self.update_performance_dashboard(metrics)
+        
+        if not self._should_flush():
+            return None
+        return await self.flush_async()
+
+
+if __name__ == "__main__":
+    # 테스트 실행 (with 블록 종료 시 대기열 커밋)
+    with GitHubSync(
+        repo="GilbertKwak/ai-multiagent-framework-v4",
+        commit_interval=10
+    ) as sync:
+        # 실행 횟수 증가
+        run_num = sync.increment_run()
+        
+        # 테스트 메트릭
+        test_metrics = {
+            "benchmark_score": 0.97,
+            "token_efficiency": 0.62,
+            "execution_time": "3.2 min",
+            "forgetting_score": 0.018
+        }
+        
+        # 커밋 테스트 (장기 실행 프로세스에서는 N회마다 한 번에 커밋)
         sync.commit_execution_log(run_num, test_metrics, "Test execution")
         sync.update_performance_dashboard(test_metrics)
     
@@ -0,0 +1,54 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from github import GithubException  # noqa: E402
+
+from github_sync import GitHubSync  # noqa: E402
+
+
+class StubRepo:
+    """get_contents만 흉내 내는 리포지토리 (경로 → 내용)"""
+
+    def __init__(self, files=None):
+        self.files = dict(files or {})
+
+    def get_contents(self, path, ref=None):
+        if path in self.files:
+            return SimpleNamespace(
+                path=path, decoded_content=self.files[path].encode("utf-8")
+            )
+        listing = [
+            SimpleNamespace(path=p, decoded_content=c.encode("utf-8"))
+            for p, c in sorted(self.files.items())
+            if p.startswith(f"{path}/")
+        ]
+        if not listing:
+            raise GithubException(404, {"message": "Not Found"}, {})
+        return listing
+
+
+@pytest.fixture
+def make_sync(tmp_path, monkeypatch):
+    """작업 디렉토리를 tmp_path로 옮긴 뒤 StubRepo를 쓰는 GitHubSync 생성"""
+    monkeypatch.chdir(tmp_path)
+    created = []
+
+    def factory(files=None, **kwargs):
+        sync = GitHubSync("owner/repo", token="test-token", **kwargs)
+        sync.repo = StubRepo(files)
+        # REST/GraphQL 직접 호출 대신 PyGithub 경로(StubRepo) 사용
+        if sync._http is not None:
+            sync._http.close()
+            sync._http = None
+        created.append(sync)
+        return sync
+
+    yield factory
+
+    for sync in created:
+        sync.close()
@@ -0,0 +1,78 @@
+from github import GithubException
+
+from github_sync import DASHBOARD_FILE, DASHBOARD_ROWS_DIR
+
+HEADER = "timestamp,benchmark_score,token_usage,execution_time,forgetting_score\n"
+
+
+def row_path(name):
+    return f"{DASHBOARD_ROWS_DIR}/{name}.csv"
+
+
+def test_merges_committed_and_pending_rows_in_time_order(make_sync):
+    sync = make_sync({
+        DASHBOARD_FILE: HEADER + "old\n",
+        row_path(100): "r100\n",
+        row_path(300): "r300\n",
+    })
+    files = {row_path(200): "r200\n", row_path(400): "r400\n"}
+
+    compacted, message = sync._compact_dashboard(files, "base")
+
+    assert compacted[DASHBOARD_FILE] == HEADER + "old\nr100\nr200\nr300\nr400\n"
+    assert message == "🗜️ Compact performance metrics: 4 row(s)"
+
+
+def test_same_run_rows_split_across_commits_are_concatenated(make_sync):
+    sync = make_sync({
+        DASHBOARD_FILE: HEADER,
+        row_path(100): "first\n",
+    })
+    files = {row_path(100): "second\n"}
+
+    compacted, _ = sync._compact_dashboard(files, "base")
+
+    assert compacted[DASHBOARD_FILE] == HEADER + "first\nsecond\n"
+    assert compacted[row_path(100)] is None
+
+
+def test_committed_row_files_are_deleted_and_pending_rows_dropped(make_sync):
+    sync = make_sync({
+        DASHBOARD_FILE: HEADER,
+        row_path(100): "r100\n",
+        row_path(200): "r200\n",
+    })
+    files = {
+        row_path(300): "r300\n",
+        "logs/execution_1_1_1.json": "{}",
+    }
+
+    compacted, _ = sync._compact_dashboard(files, "base")
+
+    assert compacted == {
+        "logs/execution_1_1_1.json": "{}",
+        DASHBOARD_FILE: HEADER + "r100\nr200\nr300\n",
+        row_path(100): None,
+        row_path(200): None,
+    }
+    # 원래 대기열은 그대로 (커밋 실패 시 재시도용)
+    assert row_path(300) in files
+
+
+def test_missing_csv_starts_with_header(make_sync):
+    sync = make_sync({row_path(100): "r100\n"})
+
+    compacted, _ = sync._compact_dashboard({}, "base")
+
+    assert compacted[DASHBOARD_FILE] == HEADER + "r100\n"
+
+
+def test_fetch_failure_skips_compaction(make_sync):
+    sync = make_sync()
+
+    def fail(*args, **kwargs):
+        raise GithubException(401, {"message": "Bad credentials"}, {})
+
+    sync.repo.get_contents = fail
+
+    assert sync._compact_dashboard({row_path(100): "r100\n"}, "base") is None
@@ -0,0 +1,41 @@
+from pathlib import Path
+
+from github_sync import RUN_COUNT_DIGITS, RUN_COUNT_SIZE
+
+COUNTER = Path(".github_run_count")
+
+
+def test_new_counter_file_starts_at_zero(make_sync):
+    sync = make_sync()
+
+    assert sync.run_count == 0
+    assert COUNTER.read_bytes() == b"0" * RUN_COUNT_DIGITS + b"\n"
+
+
+def test_legacy_variable_width_file_is_converted(make_sync):
+    COUNTER.write_text("42")
+
+    sync = make_sync()
+
+    assert sync.run_count == 42
+    assert COUNTER.stat().st_size == RUN_COUNT_SIZE
+    assert COUNTER.read_bytes() == b"%0*d\n" % (RUN_COUNT_DIGITS, 42)
+
+
+def test_legacy_file_with_newline_is_converted(make_sync):
+    COUNTER.write_text("7\n")
+
+    sync = make_sync()
+
+    assert sync.run_count == 7
+    assert COUNTER.read_bytes() == b"%0*d\n" % (RUN_COUNT_DIGITS, 7)
+
+
+def test_increment_after_conversion_persists(make_sync):
+    COUNTER.write_text("42")
+    sync = make_sync()
+
+    sync.increment_run()
+    sync.close()
+
+    assert make_sync().run_count == 43